@@ -1,14 +1,19 @@
 #!/usr/bin/env python
 from os.path import dirname, join, realpath
 
-from karabo.packaging.versioning import device_scm_version
-from setuptools import find_packages, setup
+from setuptools import setup
 
 ROOT_FOLDER = dirname(realpath(__file__))
-scm_version = device_scm_version(
-    ROOT_FOLDER,
-    join(ROOT_FOLDER, 'src', 'FunctionGenerator', '_version.py')
-)
+
+
+def scm_version():
+    # karabo.packaging is only needed once setuptools_scm asks for the
+    # version, keep it off the import path of setup.py
+    from karabo.packaging.versioning import device_scm_version
+    return device_scm_version(
+        ROOT_FOLDER,
+        join(ROOT_FOLDER, 'src', 'FunctionGenerator', '_version.py')
+    )
 
 
 setup(name='FunctionGenerator',
@@ -19,7 +24,7 @@ setup(name='FunctionGenerator',
       long_description='',
       url='',
       package_dir={'': 'src'},
-      packages=find_packages('src'),
+      packages=['FunctionGenerator', 'FunctionGenerator.tests'],
       entry_points={
           'karabo.middlelayer_device': [
               'AFG31000 = FunctionGenerator.AFG31000:AFG31000',
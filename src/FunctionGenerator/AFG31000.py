@@ -4,6 +4,8 @@
 # Copyright (C) European XFEL GmbH Schenefeld. All rights reserved.
 #############################################################################
 
+from types import MappingProxyType
+
 from karabo.middlelayer import Assignment, Double, Node, String, Unit
 
 from .FunctionGenerator import ChannelNodeBase, FunctionGenerator
@@ -11,18 +13,20 @@ from .FunctionGenerator import ChannelNodeBase, FunctionGenerator
 
 class AFGChannelNode(ChannelNodeBase):
 
-    func_shape_dict = {'SIN': 'Sine',
-                       'SQU': 'Square',
-                       'RAMP': 'Ramp',
-                       'PULS': 'Pulse',
-                       'PRN': 'PR Noise',
-                       'SINC': 'Sin(x)/x',
-                       'GAUS': 'Gaussian',
-                       'DC': 'DC',
-                       'LOR': 'Lorentz',
-                       'ERIS': 'Exponential Rise',
-                       'EDEC': 'Exponential Decay',
-                       'HAV': 'Haversine'}
+    func_shape_dict = MappingProxyType({'SIN': 'Sine',
+                                        'SQU': 'Square',
+                                        'RAMP': 'Ramp',
+                                        'PULS': 'Pulse',
+                                        'PRN': 'PR Noise',
+                                        'SINC': 'Sin(x)/x',
+                                        'GAUS': 'Gaussian',
+                                        'DC': 'DC',
+                                        'LOR': 'Lorentz',
+                                        'ERIS': 'Exponential Rise',
+                                        'EDEC': 'Exponential Decay',
+                                        'HAV': 'Haversine'})
+    func_shape_decode = MappingProxyType(
+        {v: k for k, v in func_shape_dict.items()})
 
     functionShape = String(
         displayedName='Function Shape',
@@ -40,13 +44,12 @@ class AFGChannelNode(ChannelNodeBase):
 
     def func_setter(self, value):
         value = str(value)
-        if value in self.func_shape_dict.keys():
-            value = self.func_shape_dict[value]
+        value = self.func_shape_dict.get(value, value)
         try:
             self.functionShape = value
         except ValueError:
-            self.status = f"Function shape return value {value} not one " \
-                          f"of the valid options"
+            self.get_root().status = f"Function shape return value " \
+                                     f"{value} not one of the valid options"
 
     functionShape.__set__ = func_setter
 
@@ -94,12 +97,12 @@ class AFGChannelNode(ChannelNodeBase):
         displayedName='Burst Delay',
         unitSymbol=Unit.SECOND,
         alias='SOURce{channel_no}:BURS:TDEL',
-        description={"Specifies a time delay between the trigger and the "
-                     "signal output. This command is available only in the "
-                     "Triggered burst mode. "
-                     "The setting range is 0.0 ns to 85.000 s with "
-                     "resolution of 100 ps or 5 digits. "
-                     "Choose a number in range or MIN or MAX."},
+        description="Specifies a time delay between the trigger and the "
+                    "signal output. This command is available only in the "
+                    "Triggered burst mode. "
+                    "The setting range is 0.0 ns to 85.000 s with "
+                    "resolution of 100 ps or 5 digits. "
+                    "Choose a number in range or MIN or MAX.",
         defaultValue='MIN',
         # TODO default not needed for Assignment.INTERNAL if Karabo >= 2.16.3
         assignment=Assignment.INTERNAL)
@@ -4,6 +4,11 @@
 # Copyright (C) European XFEL GmbH Schenefeld. All rights reserved.
 #############################################################################
 
+from asyncio import CancelledError
+from contextlib import suppress
+from functools import lru_cache
+from types import MappingProxyType
+
 from karabo.middlelayer import (AccessMode, Assignment, Double, KaraboValue,
                                 Overwrite, Slot, State, String, Unit,
                                 background)
@@ -12,6 +17,23 @@ from scpiml import BaseScpiDevice, ScpiConfigurable
 from ._version import version as deviceVersion
 
 
+# aliases and channel numbers are fixed, so every combination is formatted
+# once instead of on each poll and command
+@lru_cache(maxsize=None)
+def node_alias(alias, channel_no):
+    return alias.format(channel_no=channel_no)
+
+
+@lru_cache(maxsize=None)
+def node_query(alias, channel_no):
+    return f"{node_alias(alias, channel_no)}?\n"
+
+
+# hardware replies and karabo values for 'ON'/'OFF' options
+ON_OFF = MappingProxyType({'ON': 'ON', 'OFF': 'OFF', '1': 'ON', '0': 'OFF',
+                           1: 'ON', 0: 'OFF'})
+
+
 class ChannelNodeBase(ScpiConfigurable):
 
     # also needed as global value in the node as it will be the 'self' when
@@ -19,34 +41,34 @@ class ChannelNodeBase(ScpiConfigurable):
     commandReadBack = True
     readOnConnect = True
 
+    # scpi function shapes to human readable options and back, filled in
+    # by the specific implementation, read-only as they are shared by all
+    # instances of the class
+    func_shape_dict = MappingProxyType({})
+    func_shape_decode = MappingProxyType({})
+
     def on_off_setter(self, value, key):
+        value = ON_OFF.get(value, value)
         if value not in ('ON', 'OFF'):
-            try:
-                value = int(value)
-                if value == 0:
-                    value = 'OFF'
-                elif value == 1:
-                    value = 'ON'
-            except ValueError:
-                pass
-
+            # other spellings of a numeric reply, e.g. '+1' or ' 0'
+            with suppress(ValueError):
+                value = ON_OFF.get(int(value), value)
         try:
             setattr(self, key, value)
         except ValueError as e:
             msg = f"{key} return value {value} is not one " \
                   "of the valid options"
-            self.status = msg
+            # the nodes have no status, report on the device
+            self.get_root().status = msg
             raise e
 
     @Slot(displayedName="On", allowedStates=[State.NORMAL])
     async def channelOn(self):
-        descr = getattr(self.__class__, "outputState")
-        await descr.setter(self, "ON")
+        await self.__class__.outputState.setter(self, "ON")
 
     @Slot(displayedName="Off", allowedStates=[State.NORMAL])
     async def channelOff(self):
-        descr = getattr(self.__class__, "outputState")
-        await descr.setter(self, "OFF")
+        await self.__class__.outputState.setter(self, "OFF")
 
     outputState = String(
         displayedName='Output State',
@@ -104,7 +126,7 @@ class ChannelNodeBase(ScpiConfigurable):
         displayedName='Voltage Low',
         unitSymbol=Unit.VOLT,
         alias='SOURce{channel_no}:VOLT:LOW',
-        description={"Waveform low voltage"},
+        description="Waveform low voltage.",
         defaultValue=0.,
         # TODO default not needed for Assignment.INTERNAL if Karabo >= 2.16.3
         assignment=Assignment.INTERNAL)
@@ -235,14 +257,30 @@ class FunctionGenerator(BaseScpiDevice):
     commandReadBack = True
     readOnConnect = True
 
+    # only one connection attempt may run at a time
+    connect_task = None
+
     @Slot(displayedName="Connect",
           allowedStates=[State.UNKNOWN])
     async def connectAction(self):
-        background(self.connect())
+        if self.connect_task is None or self.connect_task.done():
+            self.connect_task = background(self.connect())
 
     async def connect(self):
         await super().connect()
 
+    async def onDestruction(self):
+        # a pending connection attempt must be gone before the base class
+        # tears down the connection, whatever it ends with
+        try:
+            if (self.connect_task is not None
+                    and not self.connect_task.done()):
+                self.connect_task.cancel()
+                with suppress(CancelledError, Exception):
+                    await self.connect_task
+        finally:
+            await super().onDestruction()
+
     # CHANNEL independent parameters
     identification = String(
         displayedName='Identification',
@@ -279,45 +317,27 @@ class FunctionGenerator(BaseScpiDevice):
         else:
             self.state = State.UNKNOWN
 
-    # create the nodes in the specific implementation inheriting from
-    # ChannelNodeBase
-    # channel_1 = Node(ChannelNodeBase, displayedName='channel 1', alias="1")
-    # channel_2 = Node(ChannelNodeBase, displayedName='channel 2', alias="2")
+    # the channel nodes are created in the specific implementation from a
+    # class inheriting from ChannelNodeBase
 
     # this device does not return anything after commands
     async def readCommandResult(self, descriptor, value):
-        # exception for query commands that do return a response
-        if descriptor.key in ["arbs", "catalog", "currentArbForm"]:
+        # exception for query commands that do return a response, they are
+        # marked with commandReply on the descriptor
+        if getattr(descriptor, "commandReply", False):
             return await self.get_root().readQueryResult(descriptor)
         else:
             return None
 
     # override methods to create queries and commands for parameters in nodes
     def createNodeQuery(self, descr, child):
-        scpi_add = descr.alias.format(channel_no=child.alias)
-        return f"{scpi_add}?\n"
+        return node_query(descr.alias, child.alias)
 
     def createNodeCommand(self, descr, value, child):
-        scpi_add = descr.alias.format(channel_no=child.alias)
+        scpi_add = node_alias(descr.alias, child.alias)
         value = value.value if isinstance(value, KaraboValue) else value
         # special treatment for functionShape to map human readable options
         # to scpi command/returns
-        value = self.func_shape_decode.get(value, value)
+        value = child.func_shape_decode.get(value, value)
         return (getattr(descr, "commandFormat", self.command_format)
                 .format(alias=scpi_add, device=self, value=value))
-
-    func_shape_decode = {'Sine': 'SIN',
-                         'Square': 'SQU',
-                         'Ramp': 'RAMP',
-                         'Triangle': 'TRI',
-                         'Pulse': 'PULS',
-                         'Noise': 'NOIS',
-                         'PRBS': 'PRBS',
-                         'Arbitrary': 'ARB',
-                         'DC': 'DC',
-                         'PR Noise': 'PRN',
-                         'Sin(x)/x': 'SINC',
-                         'Lorentz': 'LOR',
-                         'Exponential Rise': 'ERSI',
-                         'Exponential Decay': 'EDEC',
-                         'Harvesine': 'HAV'}
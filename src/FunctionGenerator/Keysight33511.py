@@ -4,18 +4,15 @@
 # Copyright (C) European XFEL GmbH Schenefeld. All rights reserved.
 #############################################################################
 
-from karabo.middlelayer import Node
-
 from .KeysightBase import KeysightBase
-from .KeysightChannelNode import KeysightChannelNode
+from .KeysightChannelNode import channel_node
 
 
 class Keysight33511(KeysightBase):
 
-    channel_1 = Node(KeysightChannelNode,
-                     displayedName='channel 1',
-                     alias="1")
+    channel_1 = channel_node(1)
 
     async def onInitialization(self):
         # get the parent base class into the channel node
         self.channel_1.setup(self.parent)
+        await super().onInitialization()
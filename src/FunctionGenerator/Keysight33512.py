@@ -4,22 +4,17 @@
 # Copyright (C) European XFEL GmbH Schenefeld. All rights reserved.
 #############################################################################
 
-from karabo.middlelayer import Node
-
 from .KeysightBase import KeysightBase
-from .KeysightChannelNode import KeysightChannelNode
+from .KeysightChannelNode import channel_node
 
 
 class Keysight33512(KeysightBase):
 
-    channel_1 = Node(KeysightChannelNode,
-                     displayedName='channel 1',
-                     alias="1")
-    channel_2 = Node(KeysightChannelNode,
-                     displayedName='channel 2',
-                     alias="2")
+    channel_1 = channel_node(1)
+    channel_2 = channel_node(2)
 
     async def onInitialization(self):
         # get the parent base class into the channel node
         self.channel_1.setup(self.parent)
         self.channel_2.setup(self.parent)
+        await super().onInitialization()
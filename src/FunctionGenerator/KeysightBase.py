@@ -4,12 +4,17 @@
 # Copyright (C) European XFEL GmbH Schenefeld. All rights reserved.
 #############################################################################
 
+import re
 from asyncio import wait_for
 
 from karabo.middlelayer import (AccessLevel, AccessMode, Assignment, Overwrite,
                                 Slot, State, String)
 
-from .FunctionGenerator import FunctionGenerator
+from .FunctionGenerator import ON_OFF, FunctionGenerator
+
+# waveform and sequence files in the comma separated catalog reply,
+# without the quotes around the file entries
+ARB_FILE = re.compile(r'[^",]*\.(?:arb|seq)[^",]*')
 
 
 class KeysightBase(FunctionGenerator):
@@ -32,17 +37,20 @@ class KeysightBase(FunctionGenerator):
     @Slot(displayedName="Get Waveforms",
           allowedStates=[State.NORMAL])
     async def getArbs(self):
-        descr = getattr(self.__class__, "arbs")
         # path needs explicit quotations when send to hardware
-        await descr.setter(self, f'"{self.arbPath}"')
-        if self.arb_options:
+        await self.__class__.arbs.setter(self, f'"{self.arbPath}"')
+        # only republish the schema if the waveforms changed
+        if self.arb_options and self.arb_options != self.published_arbs:
             setattr(self.__class__, 'availableArbs',
                     Overwrite(options=self.arb_options,
                               defaultValue=self.arb_options[0]))
             await self.publishInjectedParameters()
+            self.published_arbs = self.arb_options
 
     # options will be filled after connect when read from hardware
     arb_options = None
+    # options currently injected into availableArbs
+    published_arbs = None
 
     availableArbs = String(
         displayedName='Available Waveforms',
@@ -65,10 +73,8 @@ class KeysightBase(FunctionGenerator):
     display.commandReadBack = True
 
     def display_setter(self, value):
-        if value == 0 or value == '0' or value == "OFF":
-            self.display = "OFF"
-        else:
-            self.display = "ON"
+        # anything not explicitly off means the display is on
+        self.display = ON_OFF.get(value, "ON")
 
     display.__set__ = display_setter
 
@@ -82,11 +88,11 @@ class KeysightBase(FunctionGenerator):
         accessMode=AccessMode.READONLY)
     arbs.commandFormat = '{alias}? {value}\n'
     arbs.commandReadBack = False
+    arbs.commandReply = True
     arbs.readOnConnect = False
 
     def arbs_setter(self, value):
-        self.arb_options = [a.strip('"') for a in value.split(",")
-                            if ".arb" in a or ".seq" in a]
+        self.arb_options = ARB_FILE.findall(value)
 
     arbs.__set__ = arbs_setter
 
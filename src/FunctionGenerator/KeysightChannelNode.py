@@ -4,8 +4,10 @@
 # Copyright (C) European XFEL GmbH Schenefeld. All rights reserved.
 #############################################################################
 
+from types import MappingProxyType
+
 from karabo.middlelayer import (AccessLevel, AccessMode, Assignment, Double,
-                                Slot, State, String, Unit)
+                                Node, Slot, State, String, Unit)
 
 from .FunctionGenerator import ChannelNodeBase
 
@@ -21,15 +23,17 @@ class KeysightChannelNode(ChannelNodeBase):
         # TODO default not needed for Assignment.INTERNAL if Karabo >= 2.16.3
         assignment=Assignment.INTERNAL)
 
-    func_shape_dict = {'SIN': 'Sine',
-                       'SQU': 'Square',
-                       'RAMP': 'Ramp',
-                       'TRI': 'Triangle',
-                       'PULS': 'Pulse',
-                       'NOIS': 'Noise',
-                       'PRBS': 'PRBS',
-                       'ARB': 'Arbitrary',
-                       'DC': 'DC'}
+    func_shape_dict = MappingProxyType({'SIN': 'Sine',
+                                        'SQU': 'Square',
+                                        'RAMP': 'Ramp',
+                                        'TRI': 'Triangle',
+                                        'PULS': 'Pulse',
+                                        'NOIS': 'Noise',
+                                        'PRBS': 'PRBS',
+                                        'ARB': 'Arbitrary',
+                                        'DC': 'DC'})
+    func_shape_decode = MappingProxyType(
+        {v: k for k, v in func_shape_dict.items()})
 
     functionShape = String(
         displayedName='Function Shape',
@@ -42,8 +46,7 @@ class KeysightChannelNode(ChannelNodeBase):
 
     def func_setter(self, value):
         value = str(value)
-        if value in self.func_shape_dict.keys():
-            value = self.func_shape_dict[value]
+        value = self.func_shape_dict.get(value, value)
         try:
             self.functionShape = value
         except ValueError:
@@ -194,6 +197,7 @@ class KeysightChannelNode(ChannelNodeBase):
         accessMode=AccessMode.READONLY)
     currentArbForm.commandFormat = '{alias}?\n'
     currentArbForm.commandReadBack = False
+    currentArbForm.commandReply = True
     currentArbForm.readOnConnect = True
 
     loadArbForm = String(
@@ -214,10 +218,11 @@ class KeysightChannelNode(ChannelNodeBase):
         accessMode=AccessMode.READONLY)
     catalog.commandFormat = '{alias}?\n'
     catalog.commandReadBack = False
+    catalog.commandReply = True
     catalog.readOnConnect = True
 
     def cat_setter(self, value):
-        self.loadedArbs = [a.strip('"') for a in value.split(",")]
+        self.loadedArbs = value.replace('"', '').split(',')
         # TODO: built a proper option lists to be used in select arb
         # for now display in status see getLoadedArbs
 
@@ -247,50 +252,52 @@ class KeysightChannelNode(ChannelNodeBase):
     async def selectArb(self):
         # make sure function shape is set to ARB otherwise hardware
         # behaves strange and gets stuck in timeouts
-        descr = getattr(self.__class__, "functionShape")
-        await descr.setter(self, "Arbitrary")
-        descr = getattr(self.__class__, "selectArbForm")
-        arb = self.get_root().availableArbs.value
-        await descr.setter(self, fr'"{self.parent.arbPath}\{arb.upper()}"')
+        await self.__class__.functionShape.setter(self, "Arbitrary")
+        arb = self.parent.availableArbs.value
+        await self.__class__.selectArbForm.setter(
+            self, fr'"{self.parent.arbPath}\{arb.upper()}"')
         await self.getCurrentArb()
 
     @Slot(displayedName="Load Waveform",
           allowedStates=[State.NORMAL])
     async def loadArb(self):
-        arb = self.get_root().availableArbs.value
+        arb = self.parent.availableArbs.value
         await self.load_one_arb(fr'"{self.parent.arbPath}\{arb}"')
 
     @Slot(displayedName="Load All Waveforms",
           allowedStates=[State.NORMAL])
     async def loadAllArb(self):
-        arbs = getattr(self.get_root().__class__, "availableArbs")
+        arbs = self.parent.__class__.availableArbs
+        load = self.__class__.loadArbForm
+        path = self.parent.arbPath
         for wv in arbs.options:
-            name = fr'"{self.parent.arbPath}\{wv}"'
-            await self.load_one_arb(name)
+            await load.setter(self, fr'"{path}\{wv}"')
 
     async def load_one_arb(self, name):
-        descr = getattr(self.__class__, "loadArbForm")
-        await descr.setter(self, name)
+        await self.__class__.loadArbForm.setter(self, name)
 
     @Slot(displayedName="Show Loaded Waveforms",
           allowedStates=[State.NORMAL])
     async def getLoadedArbs(self):
-        descr = getattr(self.__class__, "catalog")
-        await descr.setter(self, "")
-        msg = f"Loaded Waveforms on channel {self.alias}: \n"
-        for wv in self.loadedArbs:
-            msg += wv + "\n"
-        self.parent.status = msg
+        await self.__class__.catalog.setter(self, "")
+        waveforms = "".join(f"{wv}\n" for wv in self.loadedArbs)
+        self.parent.status = (f"Loaded Waveforms on channel {self.alias}: \n"
+                              f"{waveforms}")
 
     @Slot(displayedName="Show Current Waveforms",
           allowedStates=[State.NORMAL])
     async def getCurrentArb(self):
-        descr = getattr(self.__class__, "currentArbForm")
-        await descr.setter(self, "")
+        await self.__class__.currentArbForm.setter(self, "")
         self.parent.status = f"Current waveform: {self.currentArbForm}"
 
     @Slot(displayedName="Clear Memory",
           allowedStates=[State.NORMAL])
     async def clearMemory(self):
-        descr = getattr(self.__class__, "clearMem")
-        await descr.setter(self, "")
+        await self.__class__.clearMem.setter(self, "")
+
+
+def channel_node(channel_no):
+    """Create the node for channel `channel_no` of a Keysight device"""
+    return Node(KeysightChannelNode,
+                displayedName=f'channel {channel_no}',
+                alias=str(channel_no))
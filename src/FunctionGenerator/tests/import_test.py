@@ -0,0 +1,28 @@
+#############################################################################
+# Copyright (C) European XFEL GmbH Schenefeld. All rights reserved.
+#############################################################################
+import os
+import os.path as op
+import subprocess
+import sys
+
+import FunctionGenerator
+
+# the device classes are resolved by the entry points, importing the
+# package itself must stay free of the karabo and scpiML stack
+CHECK_IMPORT = """
+import sys
+import FunctionGenerator
+heavy = [mod for mod in ('karabo.middlelayer', 'scpiml')
+         if mod in sys.modules]
+assert not heavy, f"package import pulled in {heavy}"
+"""
+
+
+def test_package_import_is_lazy():
+    # import the package under test, not whatever happens to be installed
+    src_dir = op.dirname(op.dirname(op.abspath(FunctionGenerator.__file__)))
+    python_path = os.environ.get('PYTHONPATH')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [src_dir, python_path])))
+    subprocess.check_call([sys.executable, '-c', CHECK_IMPORT], env=env)